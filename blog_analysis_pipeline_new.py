@@ -19,27 +19,29 @@ import sys
 import logging
 import re
 import time
+import asyncio
+import hashlib
+import itertools
 from datetime import datetime, date
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
 import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
-# Data processing and database libraries
-import pandas as pd
+# Database libraries
 import psycopg2
 from psycopg2.extras import RealDictCursor
 from psycopg2 import sql
 
 # Web scraping libraries
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+from selectolax.parser import HTMLParser
 from urllib.parse import urljoin, urlparse
 
 # Text analysis libraries
-import textstat
 import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.sentiment import SentimentIntensityAnalyzer
 
 # Configure logging
 logging.basicConfig(
@@ -52,6 +54,277 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Number of analyzed posts buffered before they are written to the Texts table
+TEXT_INSERT_BATCH_SIZE = 500
+
+# Largest magnitude a DECIMAL(5,2) column of the Texts table can hold
+TEXT_DECIMAL_LIMIT = 999.99
+
+# Scraper concurrency limits
+MAX_CONCURRENT_REQUESTS = 64
+MAX_REQUESTS_PER_HOST = 4
+MAX_CONCURRENT_COMPANIES = 16
+
+# Random delay range (seconds) between two requests to the same domain
+DOMAIN_DELAY_RANGE = (1, 3)
+
+# Retries for transient fetch failures (connection errors, timeouts, 429/5xx),
+# with exponential backoff of FETCH_BACKOFF_FACTOR * 2 ** attempt seconds
+FETCH_RETRIES = 3
+FETCH_BACKOFF_FACTOR = 0.5
+
+# Precompiled tokenizers used by the text analysis. Words are runs of Unicode
+# letters, optionally joined by straight or curly apostrophes.
+_WORD_RE = re.compile(r"[^\W\d_]+(?:['’][^\W\d_]+)*")
+_SENT_RE = re.compile(r'(?<=[.!?])\s+')
+_WS_RE = re.compile(r'\s+')
+_VOWEL_GROUP_RE = re.compile(r'[aeiouyàáâãäåæèéêëìíîïòóôõöøœùúûüýÿ]+')
+
+# URL path segments that indicate a blog post link
+_BLOG_RE = re.compile(r'(?:^|/)(?:blog|post|article|news|insight)s?(?:[/.?#_-]|$)', re.IGNORECASE)
+
+# Publication date patterns, searched in a single pass over the raw page bytes
+_DATE_RE = re.compile(
+    rb'(\d{4}-\d{2}-\d{2})'  # YYYY-MM-DD
+    rb'|(\d{2}/\d{2}/\d{4})'  # MM/DD/YYYY
+    rb'|(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4})'  # DD Month YYYY
+)
+_DATE_FORMATS = ('%Y-%m-%d', '%m/%d/%Y', '%d %b %Y')
+
+# Tone indicator word stems, checked in priority order. A word counts as an
+# indicator when it starts with one of the stems, so inflections such as
+# "inspires", "encouraged" or "supports" are matched as well.
+_TONE_STEMS = {
+    "Inspirational": ('inspir', 'motivat', 'encourag', 'dream', 'vision'),
+    "Authoritative": ('expert', 'authorit', 'certif', 'proven', 'research'),
+    "Persuasive": ('convinc', 'persua', 'should', 'must'),
+    "Humorous": ('funny', 'humor', 'humour', 'joke', 'joking', 'hilarious', 'amus'),
+    "Empathetic": ('understand', 'empath', 'feel', 'care', 'caring', 'support'),
+}
+# Stems with a leading space, matched against ' ' + the space-joined words so
+# the word-start check runs as a C substring search
+_TONE_NEEDLES = {label: tuple(' ' + stem for stem in stems) for label, stems in _TONE_STEMS.items()}
+
+# Responses larger than this (in bytes) are abandoned instead of parsed
+MAX_RESPONSE_BYTES = 2_000_000
+
+# Response content types the scraper will parse
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+# Default headers sent with every request of the shared HTTP session
+SESSION_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Encoding': 'gzip, deflate',
+}
+
+
+class DomainRateLimiter:
+    """
+    Enforce a randomized minimum delay between requests to the same domain.
+    Requests to different domains are not delayed by each other.
+    """
+    
+    def __init__(self, min_delay: float, max_delay: float):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self._last_request: Dict[str, float] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+    
+    async def wait(self, url: str):
+        """
+        Sleep until a request to the domain of the given URL is allowed.
+        
+        Args:
+            url: The URL about to be requested
+        """
+        domain = urlparse(url).netloc
+        lock = self._locks.setdefault(domain, asyncio.Lock())
+        async with lock:
+            last_request = self._last_request.get(domain)
+            if last_request is not None:
+                delay = random.uniform(self.min_delay, self.max_delay)
+                since = time.monotonic() - last_request
+                if since < delay:
+                    await asyncio.sleep(delay - since)
+            self._last_request[domain] = time.monotonic()
+
+
+def _load_stop_words() -> frozenset:
+    """
+    Load the English stop words, downloading the NLTK corpus only if it is missing.
+    
+    Returns:
+        frozenset of stop words (a small built-in list if NLTK data is unavailable)
+    """
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        try:
+            nltk.download('stopwords', quiet=True)
+        except Exception as e:
+            logger.warning(f"Could not download NLTK data: {e}")
+    
+    try:
+        return frozenset(stopwords.words('english'))
+    except Exception:
+        return frozenset(['the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'])
+
+
+# Stop words excluded from the word frequency analysis. Loaded once at import,
+# so analysis worker processes get them via fork (or their own import on spawn).
+_STOP = _load_stop_words()
+
+
+@lru_cache(maxsize=65536)
+def _syllable_count(word: str) -> int:
+    """
+    Estimate the number of syllables in a lower-cased word.
+    
+    Counts vowel groups, ignoring a trailing silent 'e'. Cached because
+    the same words repeat heavily across posts.
+    
+    Args:
+        word: The word to count syllables for
+        
+    Returns:
+        Estimated syllable count (at least 1)
+    """
+    count = len(_VOWEL_GROUP_RE.findall(word))
+    if count > 1 and word.endswith('e') and not word.endswith(('le', 'ee')):
+        count -= 1
+    return max(1, count)
+
+
+def _extract_publication_date(tree: HTMLParser, content: bytes) -> Optional[date]:
+    """
+    Extract the publication date of a blog post.
+    
+    Prefers explicit <time datetime> / article:published_time markup and
+    falls back to the first date-like string in the raw page.
+    
+    Args:
+        tree: The parsed page
+        content: The raw page body
+        
+    Returns:
+        The publication date, or None if no valid date was found
+    """
+    date_node = tree.css_first('time[datetime], meta[property="article:published_time"]')
+    if date_node:
+        value = date_node.attributes.get('datetime') or date_node.attributes.get('content') or ''
+        try:
+            return date.fromisoformat(value.strip()[:10])
+        except ValueError:
+            pass
+    
+    for date_match in _DATE_RE.finditer(content):
+        for value, date_format in zip(date_match.groups(), _DATE_FORMATS):
+            if value:
+                try:
+                    return datetime.strptime(' '.join(value.decode().split()), date_format).date()
+                except ValueError:
+                    break
+    return None
+
+
+def _clamp(value: float, limit: float) -> float:
+    """Clamp value to the range [-limit, limit]."""
+    return max(-limit, min(limit, value))
+
+
+def analyze_text_content(content_text: str) -> Dict[str, any]:
+    """
+    Perform comprehensive text analysis on the content.
+    
+    Kept at module level so it can be dispatched to a ProcessPoolExecutor.
+    
+    Args:
+        content_text: The text content to analyze
+        
+    Returns:
+        Dictionary containing analysis results
+    """
+    try:
+        # Tokenize once; the tokens are shared by every statistic below
+        # Curly apostrophes are normalized so "don’t" matches the stop word list
+        words = _WORD_RE.findall(content_text.lower().replace('’', "'"))
+        n_words = len(words)
+        n_sents = len(_SENT_RE.split(content_text))
+        
+        # Basic text statistics
+        avg_sentence_length = n_words / n_sents if n_sents else 0.0
+        
+        # Reading time (average reading speed: 200 words per minute)
+        avg_reading_time = max(1, round(n_words / 200))
+        
+        # Flesch reading ease from the token counts above
+        if n_words:
+            n_syllables = sum(_syllable_count(word) for word in words)
+            readability_score = 206.835 - 1.015 * (n_words / n_sents) - 84.6 * (n_syllables / n_words)
+        else:
+            readability_score = 0.0
+        
+        # Determine optimal complexity
+        if readability_score > 60:
+            optimal_complexity = "Too Basic"
+        elif readability_score >= 30:
+            optimal_complexity = "Optimal"
+        else:
+            optimal_complexity = "Too Complex"
+        
+        # Tone analysis
+        tone_label = analyze_tone(words)
+        
+        # Most frequent words (excluding stop words)
+        content_words = [word for word in words if word not in _STOP]
+        
+        # Get top 10 most frequent words
+        top_words = Counter(content_words).most_common(10)
+        most_frequent_words = ', '.join(word for word, _ in top_words)
+        
+        return {
+            'word_count': n_words,
+            'avg_sentence_length': round(avg_sentence_length, 2),
+            'avg_reading_time': avg_reading_time,
+            'readability_score': round(readability_score, 2),
+            'optimal_complexity': optimal_complexity,
+            'tone_label': tone_label,
+            'most_frequent_words': most_frequent_words
+        }
+        
+    except Exception as e:
+        logger.error(f"Failed to analyze text content: {e}")
+        # Return default values
+        return {
+            'word_count': 0,
+            'avg_sentence_length': 0.0,
+            'avg_reading_time': 0,
+            'readability_score': 0.0,
+            'optimal_complexity': "Informative",
+            'tone_label': "Informative",
+            'most_frequent_words': ""
+        }
+
+
+def analyze_tone(words: List[str]) -> str:
+    """
+    Analyze the tone of the content from its tone indicator words.
+    
+    Args:
+        words: Lower-cased word tokens of the content
+        
+    Returns:
+        Tone label as a string
+    """
+    joined = ' ' + ' '.join(words)
+    
+    # Check for specific tone indicators
+    for tone_label, needles in _TONE_NEEDLES.items():
+        if any(needle in joined for needle in needles):
+            return tone_label
+    return "Informative"
+
+
 class BlogAnalysisPipeline:
     """
     Main class for the blog content analysis pipeline.
@@ -68,26 +341,11 @@ class BlogAnalysisPipeline:
         self.db_config = db_config
         self.connection = None
         self.cursor = None
-        
-        # Download required NLTK data
-        try:
-            nltk.download('punkt', quiet=True)
-            nltk.download('stopwords', quiet=True)
-            nltk.download('vader_lexicon', quiet=True)
-        except Exception as e:
-            logger.warning(f"Could not download NLTK data: {e}")
-        
-        # Initialize stop words
-        try:
-            self.stop_words = set(stopwords.words('english'))
-        except:
-            self.stop_words = set(['the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'])
-        
-        # Initialize sentiment analyzer
-        try:
-            self.sentiment_analyzer = SentimentIntensityAnalyzer()
-        except:
-            self.sentiment_analyzer = None
+        self._text_buffer = []
+        self._texts_inserted = 0
+        self._semaphore = None
+        self._rate_limiter = None
+        self._analysis_pool = None
     
     def connect_to_database(self) -> bool:
         """
@@ -140,10 +398,18 @@ class BlogAnalysisPipeline:
                     readability_score DECIMAL(5,2),
                     optimal_complexity TEXT,
                     semantic_similarity_score DECIMAL(5,2),
+                    url_hash BYTEA,
                     FOREIGN KEY (company_id) REFERENCES Companies(company_id)
                 )
             """)
             
+            # One row per company and post URL, so re-runs don't duplicate posts
+            self.cursor.execute("ALTER TABLE Texts ADD COLUMN IF NOT EXISTS url_hash BYTEA")
+            self.cursor.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS texts_company_url_hash_key
+                ON Texts (company_id, url_hash)
+            """)
+            
             # Create Performance table
             self.cursor.execute("""
                 CREATE TABLE IF NOT EXISTS Performance (
@@ -174,16 +440,23 @@ class BlogAnalysisPipeline:
             bool: True if data loaded successfully, False otherwise
         """
         try:
-            # Load companies data
-            companies_df = pd.read_csv('companies.csv')
-            for _, row in companies_df.iterrows():
-                self.cursor.execute("""
-                    INSERT INTO Companies (company_id, company_name, company_url)
-                    VALUES (%s, %s, %s)
-                    ON CONFLICT (company_id) DO UPDATE SET
-                        company_name = EXCLUDED.company_name,
-                        company_url = EXCLUDED.company_url
-                """, (int(row['company_id']), str(row['company_name']), str(row['company_url'])))
+            # Stream the CSV into a staging table, then upsert in one statement
+            self.cursor.execute("""
+                CREATE TEMP TABLE companies_stage (LIKE Companies INCLUDING ALL)
+                ON COMMIT DROP
+            """)
+            with open('companies.csv', encoding='utf-8') as f:
+                self.cursor.copy_expert("""
+                    COPY companies_stage (company_id, company_name, company_url)
+                    FROM STDIN WITH CSV HEADER
+                """, f)
+            self.cursor.execute("""
+                INSERT INTO Companies (company_id, company_name, company_url)
+                SELECT company_id, company_name, company_url FROM companies_stage
+                ON CONFLICT (company_id) DO UPDATE SET
+                    company_name = EXCLUDED.company_name,
+                    company_url = EXCLUDED.company_url
+            """)
             
             self.connection.commit()
             logger.info("Companies data loaded successfully")
@@ -202,19 +475,26 @@ class BlogAnalysisPipeline:
             bool: True if data loaded successfully, False otherwise
         """
         try:
-            # Load performance data
-            performance_df = pd.read_csv('performance.csv')
-            for _, row in performance_df.iterrows():
-                self.cursor.execute("""
-                    INSERT INTO Performance (metrics_id, text_id, views, CTR, CR, reshares)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (metrics_id) DO UPDATE SET
-                        text_id = EXCLUDED.text_id,
-                        views = EXCLUDED.views,
-                        CTR = EXCLUDED.CTR,
-                        CR = EXCLUDED.CR,
-                        reshares = EXCLUDED.reshares
-                """, (int(row['metrics_id']), int(row['text_id']), int(row['views']), float(row['CTR']), float(row['CR']), int(row['reshares'])))
+            # Stream the CSV into a staging table, then upsert in one statement
+            self.cursor.execute("""
+                CREATE TEMP TABLE performance_stage (LIKE Performance INCLUDING ALL)
+                ON COMMIT DROP
+            """)
+            with open('performance.csv', encoding='utf-8') as f:
+                self.cursor.copy_expert("""
+                    COPY performance_stage (metrics_id, text_id, views, CTR, CR, reshares)
+                    FROM STDIN WITH CSV HEADER
+                """, f)
+            self.cursor.execute("""
+                INSERT INTO Performance (metrics_id, text_id, views, CTR, CR, reshares)
+                SELECT metrics_id, text_id, views, CTR, CR, reshares FROM performance_stage
+                ON CONFLICT (metrics_id) DO UPDATE SET
+                    text_id = EXCLUDED.text_id,
+                    views = EXCLUDED.views,
+                    CTR = EXCLUDED.CTR,
+                    CR = EXCLUDED.CR,
+                    reshares = EXCLUDED.reshares
+            """)
             
             self.connection.commit()
             logger.info("Performance data loaded successfully")
@@ -225,59 +505,101 @@ class BlogAnalysisPipeline:
             self.connection.rollback()
             return False
     
-    def get_company_urls(self) -> List[Tuple[int, str]]:
+    def get_company_urls(self) -> Iterator[Tuple[int, str]]:
+        """
+        Stream all company URLs from the database.
+        
+        Uses a server-side cursor so rows are fetched in batches as they are
+        consumed. The cursor is declared WITH HOLD and committed straight away,
+        so it survives the commits and rollbacks made by flush_texts() while
+        scraping is in progress. Errors are raised to the caller.
+        
+        Yields:
+            Tuples containing (company_id, company_url)
+        """
+        with self.connection.cursor(name='company_urls_cur', withhold=True) as cur:
+            cur.itersize = 500
+            cur.execute("SELECT company_id, company_url FROM Companies")
+            self.connection.commit()
+            yield from cur
+    
+    async def _fetch(self, session: aiohttp.ClientSession, url: str, timeout: int) -> bytes:
         """
-        Retrieve all company URLs from the database.
+        Fetch a URL, respecting the per-domain delay and the global concurrency limit.
+        Transient failures are retried up to FETCH_RETRIES times with exponential backoff.
+        The body is streamed, and non-HTML or oversized responses are rejected before
+        they are fully downloaded.
         
+        Args:
+            session: The shared HTTP client session
+            url: The URL to fetch
+            timeout: Total request timeout in seconds
+            
         Returns:
-            List of tuples containing (company_id, company_url)
+            The raw response body
         """
-        try:
-            self.cursor.execute("SELECT company_id, company_url FROM Companies")
-            return self.cursor.fetchall()
-        except Exception as e:
-            logger.error(f"Failed to retrieve company URLs: {e}")
-            return []
+        for attempt in range(FETCH_RETRIES + 1):
+            await self._rate_limiter.wait(url)
+            try:
+                async with self._semaphore:
+                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                        response.raise_for_status()
+                        
+                        if response.content_type not in HTML_CONTENT_TYPES:
+                            raise ValueError(f"Unsupported content type '{response.content_type}'")
+                        if response.content_length and response.content_length > MAX_RESPONSE_BYTES:
+                            raise ValueError(f"Response too large ({response.content_length} bytes)")
+                        
+                        body = bytearray()
+                        async for chunk in response.content.iter_chunked(64 * 1024):
+                            body.extend(chunk)
+                            if len(body) > MAX_RESPONSE_BYTES:
+                                raise ValueError(f"Response exceeds {MAX_RESPONSE_BYTES} bytes")
+                        return bytes(body)
+            except aiohttp.ClientResponseError as e:
+                if (e.status < 500 and e.status != 429) or attempt == FETCH_RETRIES:
+                    raise
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == FETCH_RETRIES:
+                    raise
+            
+            await asyncio.sleep(FETCH_BACKOFF_FACTOR * 2 ** attempt)
     
-    def scrape_blog_links(self, base_url: str) -> List[str]:
+    async def scrape_blog_links(self, session: aiohttp.ClientSession, base_url: str) -> List[str]:
         """
         Scrape blog post links from a company's main blog URL.
         
         Args:
+            session: The shared HTTP client session
             base_url: The main blog URL to scrape
             
         Returns:
             List of individual blog post URLs
         """
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(base_url, headers=headers, timeout=10)
-            response.raise_for_status()
+            content = await self._fetch(session, base_url, timeout=10)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = HTMLParser(content)
             
             # Common patterns for blog post links
+            seen_hrefs = set()
             blog_links = []
             
-            # Look for links that might be blog posts
-            for link in soup.find_all('a', href=True):
-                href = link.get('href')
-                if href:
-                    # Convert relative URLs to absolute
-                    full_url = urljoin(base_url, href)
-                    
-                    # Common blog post indicators
-                    if any(indicator in full_url.lower() for indicator in [
-                        '/blog/', '/post/', '/article/', '/news/', '/insights/',
-                        'blog', 'post', 'article', 'news', 'insights'
-                    ]):
-                        blog_links.append(full_url)
-            
-            # Remove duplicates and limit to reasonable number
-            blog_links = list(set(blog_links))[:20]  # Limit to 20 posts per company
+            # Look for links that might be blog posts, in page order
+            for link in tree.css('a[href]'):
+                href = link.attributes.get('href')
+                if not href or href in seen_hrefs:
+                    continue
+                seen_hrefs.add(href)
+                
+                # Convert relative URLs to absolute
+                full_url = urljoin(base_url, href)
+                
+                # Common blog post indicators
+                if _BLOG_RE.search(full_url) and full_url not in blog_links:
+                    blog_links.append(full_url)
+                    if len(blog_links) >= 20:  # Limit to 20 posts per company
+                        break
             
             logger.info(f"Found {len(blog_links)} potential blog posts at {base_url}")
             return blog_links
@@ -286,52 +608,30 @@ class BlogAnalysisPipeline:
             logger.warning(f"Failed to scrape blog links from {base_url}: {e}")
             return []
     
-    def scrape_blog_content(self, url: str) -> Optional[Dict[str, str]]:
+    async def scrape_blog_content(self, session: aiohttp.ClientSession, url: str) -> Optional[Dict[str, str]]:
         """
         Scrape content from an individual blog post URL.
         
         Args:
+            session: The shared HTTP client session
             url: The blog post URL to scrape
             
         Returns:
             Dictionary containing scraped content or None if failed
         """
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
+            content = await self._fetch(session, url, timeout=15)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = HTMLParser(content)
             
             # Extract title
             title = ""
-            title_tag = soup.find('title') or soup.find('h1') or soup.find('h2')
+            title_tag = tree.css_first('title') or tree.css_first('h1') or tree.css_first('h2')
             if title_tag:
-                title = title_tag.get_text().strip()
+                title = title_tag.text().strip()
             
             # Extract publication date (common patterns)
-            publication_date = None
-            date_patterns = [
-                r'\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
-                r'\d{2}/\d{2}/\d{4}',  # MM/DD/YYYY
-                r'\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}'  # DD Month YYYY
-            ]
-            
-            for pattern in date_patterns:
-                date_match = re.search(pattern, str(soup))
-                if date_match:
-                    try:
-                        publication_date = datetime.strptime(date_match.group(), '%Y-%m-%d').date()
-                        break
-                    except:
-                        try:
-                            publication_date = datetime.strptime(date_match.group(), '%m/%d/%Y').date()
-                            break
-                        except:
-                            continue
+            publication_date = _extract_publication_date(tree, content)
             
             # Default to today if no date found
             if not publication_date:
@@ -348,9 +648,9 @@ class BlogAnalysisPipeline:
             ]
             
             for selector in category_selectors:
-                cat_elem = soup.select_one(selector)
+                cat_elem = tree.css_first(selector)
                 if cat_elem:
-                    category = cat_elem.get_text().strip()
+                    category = cat_elem.text().strip()
                     break
             
             # Extract main content
@@ -361,26 +661,24 @@ class BlogAnalysisPipeline:
             ]
             
             for selector in content_selectors:
-                content_elem = soup.select_one(selector)
+                content_elem = tree.css_first(selector)
                 if content_elem:
                     # Remove script and style elements
-                    for script in content_elem(["script", "style"]):
-                        script.decompose()
+                    content_elem.strip_tags(['script', 'style'])
                     
-                    content_text = content_elem.get_text(separator=' ', strip=True)
+                    content_text = content_elem.text(separator=' ', strip=True)
                     if len(content_text) > 100:  # Ensure we have substantial content
                         break
             
             # If no specific content area found, try body
             if len(content_text) < 100:
-                body = soup.find('body')
+                body = tree.body
                 if body:
-                    for script in body(["script", "style"]):
-                        script.decompose()
-                    content_text = body.get_text(separator=' ', strip=True)
+                    body.strip_tags(['script', 'style'])
+                    content_text = body.text(separator=' ', strip=True)
             
             # Clean up content
-            content_text = re.sub(r'\s+', ' ', content_text).strip()
+            content_text = _WS_RE.sub(' ', content_text).strip()
             
             if len(content_text) < 50:  # Skip if content is too short
                 return None
@@ -390,168 +688,259 @@ class BlogAnalysisPipeline:
                 'publication_date': publication_date,
                 'category': category,
                 'tags': tags,
-                'content_text': content_text
+                'content_text': content_text,
+                'url_hash': hashlib.blake2b(url.encode(), digest_size=16).digest()
             }
             
         except Exception as e:
             logger.warning(f"Failed to scrape content from {url}: {e}")
             return None
     
-    def analyze_text_content(self, content_text: str) -> Dict[str, any]:
+    def insert_text_data(self, company_id: int, scraped_data: Dict[str, str], 
+                        analysis_data: Dict[str, any]) -> bool:
         """
-        Perform comprehensive text analysis on the content.
+        Queue scraped and analyzed text data for insertion into the database.
+        
+        Rows are buffered in memory and written by flush_texts() once
+        TEXT_INSERT_BATCH_SIZE rows have accumulated. Ratios that can exceed
+        their DECIMAL(5,2) columns (e.g. text without sentence punctuation)
+        are clamped so a single post cannot fail the batch.
         
         Args:
-            content_text: The text content to analyze
+            company_id: The ID of the company
+            scraped_data: Dictionary containing scraped content
+            analysis_data: Dictionary containing analysis results
             
         Returns:
-            Dictionary containing analysis results
+            bool: True if the row was queued (and any triggered flush succeeded), False otherwise
         """
-        try:
-            # Basic text statistics
-            word_count = len(content_text.split())
-            sentences = sent_tokenize(content_text)
-            avg_sentence_length = len(content_text.split()) / len(sentences) if sentences else 0
-            
-            # Reading time (average reading speed: 200 words per minute)
-            avg_reading_time = max(1, round(word_count / 200))
-            
-            # Readability score using Flesch-Kincaid
-            readability_score = textstat.flesch_reading_ease(content_text)
-            
-            # Determine optimal complexity
-            if readability_score > 60:
-                optimal_complexity = "Too Basic"
-            elif readability_score >= 30:
-                optimal_complexity = "Optimal"
-            else:
-                optimal_complexity = "Too Complex"
-            
-            # Tone analysis
-            tone_label = self.analyze_tone(content_text)
-            
-            # Most frequent words (excluding stop words)
-            words = word_tokenize(content_text.lower())
-            words = [word for word in words if word.isalpha() and word not in self.stop_words]
-            
-            if words:
-                word_freq = {}
-                for word in words:
-                    word_freq[word] = word_freq.get(word, 0) + 1
-                
-                # Get top 10 most frequent words
-                top_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:10]
-                most_frequent_words = ', '.join([word for word, _ in top_words])
-            else:
-                most_frequent_words = ""
-            
-            return {
-                'word_count': word_count,
-                'avg_sentence_length': round(avg_sentence_length, 2),
-                'avg_reading_time': avg_reading_time,
-                'readability_score': round(readability_score, 2),
-                'optimal_complexity': optimal_complexity,
-                'tone_label': tone_label,
-                'most_frequent_words': most_frequent_words
-            }
+        self._text_buffer.append((
+            company_id,
+            scraped_data['title'],
+            scraped_data['publication_date'],
+            scraped_data['category'],
+            scraped_data['tags'],
+            scraped_data['content_text'],
+            analysis_data['word_count'],
+            _clamp(analysis_data['avg_sentence_length'], TEXT_DECIMAL_LIMIT),
+            analysis_data['avg_reading_time'],
+            analysis_data['tone_label'],
+            analysis_data['most_frequent_words'],
+            _clamp(analysis_data['readability_score'], TEXT_DECIMAL_LIMIT),
+            analysis_data['optimal_complexity'],
+            0.0,  # Placeholder for semantic similarity score
+            scraped_data['url_hash']
+        ))
+        
+        if len(self._text_buffer) >= TEXT_INSERT_BATCH_SIZE:
+            return self.flush_texts()
+        return True
+    
+    def _prepare_text_insert(self):
+        """
+        Prepare the Texts insert statement on the current session if needed.
+        
+        Prepared statements live only as long as the connection, so this is
+        checked on every flush and re-issued after a reconnect.
+        """
+        self.cursor.execute("SELECT 1 FROM pg_prepared_statements WHERE name = 'ins_text'")
+        if not self.cursor.fetchone():
+            self.cursor.execute("""
+                PREPARE ins_text (int[], text[], date[], text[], text[], text[], int[], numeric[], int[],
+                                  text[], text[], numeric[], text[], numeric[], bytea[]) AS
+                INSERT INTO Texts (
+                    company_id, title, publication_date, category, tags,
+                    content_text, word_count, avg_sentence_length, avg_reading_time,
+                    tone_label, most_frequent_words, readability_score,
+                    optimal_complexity, semantic_similarity_score, url_hash
+                )
+                SELECT * FROM unnest($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15)
+                ON CONFLICT (company_id, url_hash) DO NOTHING
+            """)
+    
+    def _execute_text_insert(self, rows: List[tuple]) -> int:
+        """
+        Insert text rows with a single EXECUTE of the prepared statement,
+        passing one array per column.
+        
+        Args:
+            rows: Text rows as queued by insert_text_data
             
-        except Exception as e:
-            logger.error(f"Failed to analyze text content: {e}")
-            # Return default values
-            return {
-                'word_count': 0,
-                'avg_sentence_length': 0.0,
-                'avg_reading_time': 0,
-                'readability_score': 0.0,
-                'optimal_complexity': "Informative",
-                'tone_label': "Informative",
-                'most_frequent_words': ""
-            }
+        Returns:
+            Number of rows actually inserted (duplicates are skipped)
+        """
+        columns = [list(column) for column in zip(*rows)]
+        self.cursor.execute("""
+            EXECUTE ins_text (
+                %s::int[], %s::text[], %s::date[], %s::text[], %s::text[], %s::text[], %s::int[],
+                %s::numeric[], %s::int[], %s::text[], %s::text[], %s::numeric[], %s::text[],
+                %s::numeric[], %s::bytea[]
+            )
+        """, columns)
+        return self.cursor.rowcount
     
-    def analyze_tone(self, content_text: str) -> str:
+    def _insert_texts_row_by_row(self, rows: List[tuple]) -> int:
         """
-        Analyze the tone of the content using sentiment analysis.
+        Insert text rows one at a time, each under its own savepoint, so a
+        bad row is skipped without losing the rest of the batch.
         
         Args:
-            content_text: The text content to analyze
+            rows: Text rows as queued by insert_text_data
             
         Returns:
-            Tone label as a string
+            Number of rows actually inserted
+        """
+        self._prepare_text_insert()
+        inserted = 0
+        for row in rows:
+            self.cursor.execute("SAVEPOINT text_row")
+            try:
+                inserted += self._execute_text_insert([row])
+                self.cursor.execute("RELEASE SAVEPOINT text_row")
+            except Exception as e:
+                self.cursor.execute("ROLLBACK TO SAVEPOINT text_row")
+                logger.warning(f"Skipped text row {row[1][:50]!r} (company {row[0]}): {e}")
+        self.connection.commit()
+        return inserted
+    
+    def flush_texts(self) -> bool:
+        """
+        Write all buffered text rows to the database in a single transaction.
+        
+        If the batch fails it is rolled back and retried row by row, so only
+        the offending rows are dropped.
+        
+        Returns:
+            bool: True if insertion successful, False otherwise
         """
+        if not self._text_buffer:
+            return True
+        
+        rows = list(self._text_buffer)
+        self._text_buffer.clear()
+        
         try:
-            if not self.sentiment_analyzer:
-                return "Informative"
-            
-            # Get sentiment scores
-            sentiment_scores = self.sentiment_analyzer.polarity_scores(content_text)
-            
-            # Analyze text characteristics for tone
-            text_lower = content_text.lower()
-            
-            # Check for specific tone indicators
-            if any(word in text_lower for word in ['inspire', 'motivate', 'encourage', 'dream', 'vision']):
-                return "Inspirational"
-            elif any(word in text_lower for word in ['expert', 'authority', 'certified', 'proven', 'research']):
-                return "Authoritative"
-            elif any(word in text_lower for word in ['convince', 'persuade', 'convince', 'should', 'must']):
-                return "Persuasive"
-            elif any(word in text_lower for word in ['funny', 'humor', 'joke', 'hilarious', 'amusing']):
-                return "Humorous"
-            elif any(word in text_lower for word in ['understand', 'empathy', 'feel', 'care', 'support']):
-                return "Empathetic"
-            else:
-                return "Informative"
-                
+            self._prepare_text_insert()
+            inserted = self._execute_text_insert(rows)
+            self.connection.commit()
+            
         except Exception as e:
-            logger.warning(f"Failed to analyze tone: {e}")
-            return "Informative"
+            logger.warning(f"Batch insert of {len(rows)} text rows failed, retrying row by row: {e}")
+            self.connection.rollback()
+            try:
+                inserted = self._insert_texts_row_by_row(rows)
+            except Exception as e:
+                logger.error(f"Failed to insert {len(rows)} text rows: {e}")
+                self.connection.rollback()
+                return False
+        
+        self._texts_inserted += inserted
+        logger.info(f"Inserted {inserted} of {len(rows)} text rows")
+        return True
     
-    def insert_text_data(self, company_id: int, scraped_data: Dict[str, str], 
-                        analysis_data: Dict[str, any]) -> bool:
+    async def _process_blog_post(self, session: aiohttp.ClientSession, company_id: int, blog_url: str) -> bool:
         """
-        Insert scraped and analyzed text data into the database.
+        Scrape, analyze and queue a single blog post for insertion.
         
         Args:
+            session: The shared HTTP client session
             company_id: The ID of the company
-            scraped_data: Dictionary containing scraped content
-            analysis_data: Dictionary containing analysis results
+            blog_url: The blog post URL to process
             
         Returns:
-            bool: True if insertion successful, False otherwise
+            bool: True if the post was processed, False otherwise
         """
         try:
-            self.cursor.execute("""
-                INSERT INTO Texts (
-                    company_id, title, publication_date, category, tags,
-                    content_text, word_count, avg_sentence_length, avg_reading_time,
-                    tone_label, most_frequent_words, readability_score,
-                    optimal_complexity, semantic_similarity_score
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
-                company_id,
-                scraped_data['title'],
-                scraped_data['publication_date'],
-                scraped_data['category'],
-                scraped_data['tags'],
-                scraped_data['content_text'],
-                analysis_data['word_count'],
-                analysis_data['avg_sentence_length'],
-                analysis_data['avg_reading_time'],
-                analysis_data['tone_label'],
-                analysis_data['most_frequent_words'],
-                analysis_data['readability_score'],
-                analysis_data['optimal_complexity'],
-                0.0  # Placeholder for semantic similarity score
-            ))
+            # Scrape content
+            scraped_data = await self.scrape_blog_content(session, blog_url)
+            if not scraped_data:
+                return False
             
-            self.connection.commit()
-            return True
+            # Analyze content in a worker process so scraping I/O can continue
+            loop = asyncio.get_running_loop()
+            analysis_data = await loop.run_in_executor(
+                self._analysis_pool, analyze_text_content, scraped_data['content_text']
+            )
+            
+            # Queue for batched insert into database
+            if self.insert_text_data(company_id, scraped_data, analysis_data):
+                logger.info(f"Queued blog post: {scraped_data['title'][:50]}...")
+                return True
+            return False
             
         except Exception as e:
-            logger.error(f"Failed to insert text data: {e}")
-            self.connection.rollback()
+            logger.warning(f"Failed to process blog post {blog_url}: {e}")
             return False
     
+    async def _process_company(self, session: aiohttp.ClientSession, company_id: int, company_url: str) -> int:
+        """
+        Discover and process all blog posts of a single company.
+        
+        Args:
+            session: The shared HTTP client session
+            company_id: The ID of the company
+            company_url: The company's main blog URL
+            
+        Returns:
+            Number of blog posts successfully processed
+        """
+        logger.info(f"Processing company {company_id}: {company_url}")
+        
+        # Scrape blog post links
+        blog_links = await self.scrape_blog_links(session, company_url)
+        
+        if not blog_links:
+            logger.warning(f"No blog posts found for company {company_id}")
+            return 0
+        
+        # Scrape and analyze the blog posts concurrently
+        results = await asyncio.gather(*(
+            self._process_blog_post(session, company_id, blog_url) for blog_url in blog_links
+        ))
+        return sum(results)
+    
+    async def _scrape_companies(self, company_urls: Iterable[Tuple[int, str]]) -> int:
+        """
+        Scrape all companies concurrently over a single HTTP session.
+        
+        Companies are dispatched as they are read, with at most
+        MAX_CONCURRENT_COMPANIES in flight, so scraping starts before all
+        company rows have been fetched and rows are only read as fast as
+        they are scraped.
+        
+        Args:
+            company_urls: Iterable of (company_id, company_url) tuples
+            
+        Returns:
+            Total number of blog posts successfully processed
+        """
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._rate_limiter = DomainRateLimiter(*DOMAIN_DELAY_RANGE)
+        
+        # One pooled, keep-alive session for the whole run
+        connector = aiohttp.TCPConnector(
+            limit=MAX_CONCURRENT_REQUESTS,
+            limit_per_host=MAX_REQUESTS_PER_HOST,
+            ttl_dns_cache=300
+        )
+        # CPU-bound text analysis runs on all cores while scraping continues
+        self._analysis_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        try:
+            async with aiohttp.ClientSession(connector=connector, headers=SESSION_HEADERS) as session:
+                company_slots = asyncio.Semaphore(MAX_CONCURRENT_COMPANIES)
+                tasks = []
+                for company_id, company_url in company_urls:
+                    # Wait for a free slot before reading the next company
+                    await company_slots.acquire()
+                    task = asyncio.create_task(self._process_company(session, company_id, company_url))
+                    task.add_done_callback(lambda _: company_slots.release())
+                    tasks.append(task)
+                results = await asyncio.gather(*tasks)
+        finally:
+            self._analysis_pool.shutdown()
+            self._analysis_pool = None
+        return sum(results)
+    
     def run_scraping_pipeline(self) -> bool:
         """
         Run the complete web scraping and analysis pipeline.
@@ -563,46 +952,28 @@ class BlogAnalysisPipeline:
             logger.info("Starting web scraping pipeline...")
             
             company_urls = self.get_company_urls()
-            if not company_urls:
+            try:
+                first_company = next(company_urls, None)
+            except Exception as e:
+                logger.error(f"Failed to retrieve company URLs: {e}")
+                self.connection.rollback()
+                return False
+            if first_company is None:
                 logger.error("No company URLs found in database")
                 return False
             
-            total_posts_scraped = 0
+            total_posts_scraped = asyncio.run(
+                self._scrape_companies(itertools.chain([first_company], company_urls))
+            )
             
-            for company_id, company_url in company_urls:
-                logger.info(f"Processing company {company_id}: {company_url}")
-                
-                # Scrape blog post links
-                blog_links = self.scrape_blog_links(company_url)
-                
-                if not blog_links:
-                    logger.warning(f"No blog posts found for company {company_id}")
-                    continue
-                
-                # Scrape and analyze each blog post
-                for blog_url in blog_links:
-                    try:
-                        # Add delay to be respectful to servers
-                        time.sleep(random.uniform(1, 3))
-                        
-                        # Scrape content
-                        scraped_data = self.scrape_blog_content(blog_url)
-                        if not scraped_data:
-                            continue
-                        
-                        # Analyze content
-                        analysis_data = self.analyze_text_content(scraped_data['content_text'])
-                        
-                        # Insert into database
-                        if self.insert_text_data(company_id, scraped_data, analysis_data):
-                            total_posts_scraped += 1
-                            logger.info(f"Successfully processed blog post: {scraped_data['title'][:50]}...")
-                        
-                    except Exception as e:
-                        logger.warning(f"Failed to process blog post {blog_url}: {e}")
-                        continue
+            # Write out whatever is left in the insert buffer
+            if not self.flush_texts():
+                return False
             
-            logger.info(f"Scraping pipeline completed. Total posts processed: {total_posts_scraped}")
+            logger.info(
+                f"Scraping pipeline completed. Posts processed: {total_posts_scraped}, "
+                f"text rows stored: {self._texts_inserted}"
+            )
             return True
             
         except Exception as e:
@@ -628,7 +999,8 @@ def main():
         'database': 'blog_analysis',
         'user': 'postgres',
         'password': 'mGrOpEr',
-        'port': '5432'
+        'port': '5432',
+        'connect_timeout': '10'  # Fail fast if the server is unreachable
     }
     
     # Create pipeline instance
@@ -0,0 +1,24 @@
+-- Database setup for the Blog Analysis Pipeline.
+--
+-- Creates the blog_analysis database and the blog_user role and grants the
+-- role full access. Safe to run repeatedly: objects are only created when
+-- they are missing.
+--
+-- Usage:
+--   psql -h localhost -U postgres -v ON_ERROR_STOP=1 -v pw='user_password' -f init.sql
+--
+-- CREATE DATABASE cannot run inside a DO block or transaction, so the
+-- conditional statements are generated with SELECT and run with \gexec.
+
+SELECT 'CREATE DATABASE blog_analysis'
+WHERE NOT EXISTS (SELECT FROM pg_database WHERE datname = 'blog_analysis')\gexec
+
+SELECT format('CREATE USER blog_user WITH PASSWORD %L', :'pw')
+WHERE NOT EXISTS (SELECT FROM pg_roles WHERE rolname = 'blog_user')\gexec
+
+GRANT ALL PRIVILEGES ON DATABASE blog_analysis TO blog_user;
+
+-- PostgreSQL 15+ no longer lets every user create tables in the public
+-- schema, so grant it explicitly for the pipeline's CREATE TABLE calls.
+\connect blog_analysis
+GRANT ALL ON SCHEMA public TO blog_user;
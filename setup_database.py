@@ -4,30 +4,139 @@ Database Setup Script for Blog Analysis Pipeline
 This script helps you set up the PostgreSQL database and user for the blog analysis pipeline.
 
 Run this script BEFORE running the main pipeline script.
+
+For non-interactive setups (CI, containers) prefer init.sql, either through
+`psql -v ON_ERROR_STOP=1 -v pw=... -f init.sql` or the db-init service in
+docker-compose.yml.
 """
 
+import argparse
+import getpass
+import os
 import psycopg2
+from psycopg2 import sql
 import sys
 
-def create_database_and_user():
+def parse_args(argv=None) -> argparse.Namespace:
+    """
+    Parse the command line options of the setup script.
+    
+    Args:
+        argv: Argument list to parse (defaults to sys.argv[1:])
+        
+    Returns:
+        Parsed options
+    """
+    parser = argparse.ArgumentParser(description="Set up the PostgreSQL database for the blog analysis pipeline.")
+    parser.add_argument('--host', default='localhost', help="PostgreSQL host (default: localhost)")
+    parser.add_argument('--port', default='5432', help="PostgreSQL port (default: 5432)")
+    parser.add_argument('--admin-user', default='postgres', help="Administrative user to connect as (default: postgres)")
+    parser.add_argument('--admin-password', default=os.environ.get('PGPASSWORD'),
+                        help="Password of the administrative user (default: $PGPASSWORD)")
+    
+    user_group = parser.add_mutually_exclusive_group()
+    user_group.add_argument('--create-user', dest='create_user', action='store_true', default=None,
+                            help="Create a dedicated project user (implied by --username; "
+                                 "asked interactively when run in a terminal)")
+    user_group.add_argument('--no-create-user', dest='create_user', action='store_false',
+                            help="Use the administrative user in the pipeline configuration")
+    
+    parser.add_argument('--username', help="Name of the dedicated project user (default: blog_user)")
+    parser.add_argument('--user-password', help="Password of the dedicated project user")
+    
+    args = parser.parse_args(argv)
+    if args.create_user is None and args.username is not None:
+        args.create_user = True
+    return args
+
+def _get_secret(value, prompt):
+    """
+    Return a secret given on the command line, or prompt for it without echo
+    when running on a terminal.
+    
+    Args:
+        value: The value given on the command line or environment, if any
+        prompt: The prompt shown when asking interactively
+        
+    Returns:
+        The secret, or None if it was not given and stdin is not a terminal
+    """
+    if value is not None:
+        return value
+    if sys.stdin.isatty():
+        return getpass.getpass(prompt)
+    return None
+
+def format_db_config(config, user, password):
+    """
+    Build the db_config snippet to paste into the pipeline script.
+    
+    Returned as one string so it is written to stdout in a single call.
+    
+    Args:
+        config: Connection parameters used by this script
+        user: Database user for the pipeline
+        password: Password of that user
+        
+    Returns:
+        The formatted configuration block
+    """
+    return f"""
+📋 Use this configuration in your blog_analysis_pipeline.py:
+db_config = {{
+    'host': '{config['host']}',
+    'database': 'blog_analysis',
+    'user': '{user}',
+    'password': '{password}',
+    'port': '{config['port']}',
+    'connect_timeout': '{config['connect_timeout']}'
+}}"""
+
+def create_database_and_user(args: argparse.Namespace):
     """
     Create the database and user for the blog analysis pipeline.
+    
+    Args:
+        args: Parsed command line options (see parse_args)
     """
     print("🚀 Setting up PostgreSQL database for Blog Analysis Pipeline...")
     print("=" * 60)
     
-    # Default connection parameters (modify as needed)
+    # Resolve all choices and credentials up front so piped runs fail before connecting
+    create_user = args.create_user
+    username = args.username
+    if create_user is None:
+        # Ask like the interactive setup always did; piped runs default to the admin user
+        if sys.stdin.isatty():
+            answer = input("\nWould you like to create a dedicated user for this project? (y/n): ")
+            create_user = answer.lower().strip() == 'y'
+            if create_user:
+                username = input("Enter username for the new user (default: blog_user): ").strip()
+        else:
+            create_user = False
+    if not username:
+        username = 'blog_user'
+    
+    admin_password = _get_secret(args.admin_password, "Enter your PostgreSQL password: ")
+    if admin_password is None:
+        print("❌ No PostgreSQL password given. Use --admin-password or set PGPASSWORD.")
+        return False
+    
+    if create_user:
+        password = _get_secret(args.user_password, f"Enter password for user '{username}': ")
+        if password is None:
+            print(f"❌ No password given for user '{username}'. Use --user-password.")
+            return False
+    
+    # Connection parameters
     default_config = {
-        'host': 'localhost',
-        'user': 'postgres',
-        'password': '',  # You'll be prompted for this
-        'port': '5432'
+        'host': args.host,
+        'user': args.admin_user,
+        'password': admin_password,
+        'port': args.port,
+        'connect_timeout': '10'  # Fail fast if the server is unreachable
     }
     
-    # Get password from user
-    if not default_config['password']:
-        default_config['password'] = input("Enter your PostgreSQL password: ")
-    
     try:
         # Connect to PostgreSQL server
         print("📡 Connecting to PostgreSQL server...")
@@ -35,52 +144,43 @@ def create_database_and_user():
         conn.autocommit = True
         cursor = conn.cursor()
         
-        # Create database
-        print("🗄️  Creating database 'blog_analysis'...")
-        try:
+        # Create database (skipped when it already exists)
+        cursor.execute("SELECT 1 FROM pg_database WHERE datname = %s", ('blog_analysis',))
+        if cursor.fetchone():
+            print("ℹ️  Database 'blog_analysis' already exists.")
+        else:
+            print("🗄️  Creating database 'blog_analysis'...")
             cursor.execute("CREATE DATABASE blog_analysis")
             print("✅ Database 'blog_analysis' created successfully!")
-        except psycopg2.errors.DuplicateDatabase:
-            print("ℹ️  Database 'blog_analysis' already exists.")
         
         # Create user (optional)
-        create_user = input("\nWould you like to create a dedicated user for this project? (y/n): ").lower().strip()
-        
-        if create_user == 'y':
-            username = input("Enter username for the new user (default: blog_user): ").strip()
-            if not username:
-                username = 'blog_user'
+        if create_user:
+            # Quote the user name as an identifier instead of pasting it into the SQL
+            create_user_stmt = sql.SQL("CREATE USER {} WITH PASSWORD %s").format(sql.Identifier(username))
+            grant_stmt = sql.SQL("GRANT ALL PRIVILEGES ON DATABASE {} TO {}").format(
+                sql.Identifier('blog_analysis'), sql.Identifier(username)
+            )
             
-            password = input(f"Enter password for user '{username}': ")
-            
-            try:
-                cursor.execute(f"CREATE USER {username} WITH PASSWORD %s", (password,))
-                cursor.execute(f"GRANT ALL PRIVILEGES ON DATABASE blog_analysis TO {username}")
+            cursor.execute("SELECT 1 FROM pg_roles WHERE rolname = %s", (username,))
+            if not cursor.fetchone():
+                # Both statements go to the server in a single round-trip
+                cursor.execute(sql.SQL("; ").join([create_user_stmt, grant_stmt]), (password,))
                 print(f"✅ User '{username}' created successfully with full privileges!")
                 
                 # Show the configuration to use
-                print("\n📋 Use this configuration in your blog_analysis_pipeline.py:")
-                print(f"db_config = {{")
-                print(f"    'host': '{default_config['host']}',")
-                print(f"    'database': 'blog_analysis',")
-                print(f"    'user': '{username}',")
-                print(f"    'password': '{password}',")
-                print(f"    'port': '{default_config['port']}'")
-                print(f"}}")
+                print(format_db_config(default_config, username, password))
                 
-            except psycopg2.errors.DuplicateObject:
+            else:
                 print(f"ℹ️  User '{username}' already exists.")
-                cursor.execute(f"GRANT ALL PRIVILEGES ON DATABASE blog_analysis TO {username}")
-                print(f"✅ Privileges granted to existing user '{username}'!")
+                # CONNECT is granted to PUBLIC by default, so check CREATE instead
+                cursor.execute("SELECT has_database_privilege(%s, 'blog_analysis', 'CREATE')", (username,))
+                if cursor.fetchone()[0]:
+                    print(f"ℹ️  User '{username}' already has privileges on 'blog_analysis'.")
+                else:
+                    cursor.execute(grant_stmt)
+                    print(f"✅ Privileges granted to existing user '{username}'!")
         else:
-            print("\n📋 Use this configuration in your blog_analysis_pipeline.py:")
-            print(f"db_config = {{")
-            print(f"    'host': '{default_config['host']}',")
-            print(f"    'database': 'blog_analysis',")
-            print(f"    'user': '{default_config['user']}',")
-            print(f"    'password': '{default_config['password']}',")
-            print(f"    'port': '{default_config['port']}'")
-            print(f"}}")
+            print(format_db_config(default_config, default_config['user'], default_config['password']))
         
         print("\n🎉 Database setup completed successfully!")
         print("You can now run the main pipeline script: python blog_analysis_pipeline.py")
@@ -108,6 +208,8 @@ def main():
     """
     Main function to run the database setup.
     """
+    args = parse_args()
+    
     print("Blog Analysis Pipeline - Database Setup")
     print("=" * 40)
     
@@ -120,7 +222,7 @@ def main():
         return
     
     # Run setup
-    if create_database_and_user():
+    if create_database_and_user(args):
         print("\n✅ Setup completed successfully!")
     else:
         print("\n❌ Setup failed. Please check the error messages above.")